@@ -21,15 +21,18 @@ Notes
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext
 import os, struct, time, threading
+from array import array
 from pathlib import Path
 from datetime import datetime
 
 # --------------------------- Utilities ---------------------------
 
+# Branchless sign-extension: XOR the sign bit up to the top then subtract
+# it back out — no data-dependent branch per call.
 def u32(x): return x & 0xFFFFFFFF
-def s32(x): x &= 0xFFFFFFFF; return x if x < 0x80000000 else x - 0x100000000
-def sign16(x): x &= 0xFFFF; return x if x < 0x8000 else x - 0x10000
-def sext16(x): return u32(sign16(x))
+def s32(x): return ((x & 0xFFFFFFFF) ^ 0x80000000) - 0x80000000
+def sign16(x): return ((x & 0xFFFF) ^ 0x8000) - 0x8000
+def sext16(x): return (sign16(x)) & 0xFFFFFFFF
 
 def bits(val, lo, hi):
     """Inclusive bit slice [lo, hi] (0 = LSB)."""
@@ -59,6 +62,17 @@ class ROMHeader:
 
 # --------------------------- Byte-Order ---------------------------
 
+def _byteswap_groups(rom: bytes, typecode: str, width: int) -> bytes:
+    """
+    Reverse every `width`-byte group of `rom` with array.array.byteswap —
+    one C-level pass instead of a Python loop per group. Any tail bytes
+    that do not fill a full group are passed through unchanged.
+    """
+    cut = len(rom) & ~(width - 1)
+    arr = array(typecode, rom[:cut])
+    arr.byteswap()
+    return arr.tobytes() + rom[cut:]
+
 def normalize_rom_to_z64_be(rom: bytes) -> bytes:
     """
     Normalize ROM to standard big-endian .z64 byte order based on magic.
@@ -70,18 +84,9 @@ def normalize_rom_to_z64_be(rom: bytes) -> bytes:
     if magic == 0x80371240:  # .z64 big endian
         return rom
     elif magic == 0x40123780:  # .n64 little endian -> swap 32-bit
-        out = bytearray(len(rom))
-        for i in range(0, len(rom), 4):
-            out[i:i+4] = rom[i:i+4][::-1]
-        return bytes(out)
+        return _byteswap_groups(rom, "I", 4)
     elif magic == 0x37804012:  # .v64 byteswapped -> swap every 16-bit pair
-        out = bytearray(len(rom))
-        for i in range(0, len(rom), 2):
-            if i+1 < len(rom):
-                out[i], out[i+1] = rom[i+1], rom[i]
-            else:
-                out[i] = rom[i]
-        return bytes(out)
+        return _byteswap_groups(rom, "H", 2)
     else:
         # Unknown magic: try best-effort (assume it's already BE)
         return rom
@@ -103,20 +108,24 @@ class Memory:
         self.sp_imem = bytearray(0x1000)
         self.rom_be = None
         self.rom_size = 0
+        # Cached Struct objects: unpack_from/pack_into hit the region buffer
+        # directly, without the per-byte _read/_write round trips.
+        self._u32 = struct.Struct(">I")
+        self._u16 = struct.Struct(">H")
+        # Optional hooks fired on stores; the CPU uses them to drop stale
+        # decode/block-cache entries. on_dmem_write gets the DMEM offset,
+        # on_code_write the physical address of any RDRAM/IMEM store.
+        self.on_dmem_write = None
+        self.on_code_write = None
 
     def load_rom(self, rom_data_be: bytes):
         self.rom_be = rom_data_be
         self.rom_size = len(rom_data_be)
 
-    # --- Addressing helpers ---
-
-    @staticmethod
-    def virt_to_phys(addr: int) -> int:
-        """
-        Map KSEG0/KSEG1/USEG virtual to 'physical-like' 0x00000000.. range.
-        For our tiny model, mask to 0x1FFFFFFF to fold segments.
-        """
-        return addr & 0x1FFFFFFF
+    # --- Addressing ---
+    # KSEG0/KSEG1/USEG virtual addresses fold to a 'physical-like'
+    # 0x00000000.. range by masking with 0x1FFFFFFF; the public accessors
+    # apply that mask inline rather than through a helper call.
 
     def _read(self, phys: int, size: int) -> int:
         # SP DMEM/IMEM
@@ -139,44 +148,137 @@ class Memory:
         b = val & 0xFF
         # SP DMEM/IMEM
         if 0x04000000 <= phys <= 0x04000FFF and size == 1:
-            self.sp_dmem[phys - 0x04000000] = b; return
+            self.sp_dmem[phys - 0x04000000] = b
+            if self.on_dmem_write:
+                self.on_dmem_write(phys - 0x04000000)
+            return
         if 0x04001000 <= phys <= 0x04001FFF and size == 1:
-            self.sp_imem[phys - 0x04001000] = b; return
+            self.sp_imem[phys - 0x04001000] = b
+            if self.on_code_write:
+                self.on_code_write(phys)
+            return
         # RDRAM
         if 0x00000000 <= phys <= 0x007FFFFF and size == 1:
-            self.rdram[phys] = b; return
+            self.rdram[phys] = b
+            if self.on_code_write:
+                self.on_code_write(phys)
+            return
         # Cartridge ROM & others are read-only or ignored
 
     # --- Public byte/half/word ops ---
+    # The word/halfword paths below pick the target region with one range
+    # check and use a cached Struct against the backing bytearray; the old
+    # per-byte _read/_write chain survives only as the unmapped slow path.
 
     def read_u8(self, addr: int) -> int:
-        return self._read(self.virt_to_phys(addr), 1)
+        phys = addr & 0x1FFFFFFF
+        if phys <= 0x007FFFFF:
+            return self.rdram[phys]
+        if 0x04000000 <= phys <= 0x04000FFF:
+            return self.sp_dmem[phys - 0x04000000]
+        if 0x04001000 <= phys <= 0x04001FFF:
+            return self.sp_imem[phys - 0x04001000]
+        if 0x10000000 <= phys <= 0x1FBFFFFF and self.rom_be:
+            off = phys - 0x10000000
+            if off < self.rom_size:
+                return self.rom_be[off]
+        return 0
 
     def read_u16(self, addr: int) -> int:
-        b0 = self.read_u8(addr)
-        b1 = self.read_u8(addr + 1)
-        return (b0 << 8) | b1
+        phys = addr & 0x1FFFFFFF
+        if phys <= 0x007FFFFE:
+            return self._u16.unpack_from(self.rdram, phys)[0]
+        if 0x04000000 <= phys <= 0x04000FFE:
+            return self._u16.unpack_from(self.sp_dmem, phys - 0x04000000)[0]
+        if 0x04001000 <= phys <= 0x04001FFE:
+            return self._u16.unpack_from(self.sp_imem, phys - 0x04001000)[0]
+        if 0x10000000 <= phys < 0x1FC00000 and self.rom_be:
+            off = phys - 0x10000000
+            if off + 2 <= self.rom_size:
+                return self._u16.unpack_from(self.rom_be, off)[0]
+        # Slow path: unmapped or straddling a region edge
+        return (self._read(phys, 1) << 8) | self._read((addr + 1) & 0x1FFFFFFF, 1)
 
     def read_u32(self, addr: int) -> int:
-        b0 = self.read_u8(addr)
-        b1 = self.read_u8(addr + 1)
-        b2 = self.read_u8(addr + 2)
-        b3 = self.read_u8(addr + 3)
-        return (b0 << 24) | (b1 << 16) | (b2 << 8) | b3
+        phys = addr & 0x1FFFFFFF
+        if phys <= 0x007FFFFC:
+            return self._u32.unpack_from(self.rdram, phys)[0]
+        if 0x04000000 <= phys <= 0x04000FFC:
+            return self._u32.unpack_from(self.sp_dmem, phys - 0x04000000)[0]
+        if 0x04001000 <= phys <= 0x04001FFC:
+            return self._u32.unpack_from(self.sp_imem, phys - 0x04001000)[0]
+        if 0x10000000 <= phys < 0x1FC00000 and self.rom_be:
+            off = phys - 0x10000000
+            if off + 4 <= self.rom_size:
+                return self._u32.unpack_from(self.rom_be, off)[0]
+        # Slow path: unmapped or straddling a region edge
+        val = 0
+        for i in range(4):
+            val = (val << 8) | self._read((addr + i) & 0x1FFFFFFF, 1)
+        return val
 
     def write_u8(self, addr: int, val: int):
-        self._write(self.virt_to_phys(addr), val, 1)
+        phys = addr & 0x1FFFFFFF
+        b = val & 0xFF
+        if phys <= 0x007FFFFF:
+            self.rdram[phys] = b
+            if self.on_code_write:
+                self.on_code_write(phys)
+            return
+        if 0x04000000 <= phys <= 0x04000FFF:
+            self.sp_dmem[phys - 0x04000000] = b
+            if self.on_dmem_write:
+                self.on_dmem_write(phys - 0x04000000)
+            return
+        if 0x04001000 <= phys <= 0x04001FFF:
+            self.sp_imem[phys - 0x04001000] = b
+            if self.on_code_write:
+                self.on_code_write(phys)
+            return
+        # Cartridge ROM & others are read-only or ignored
 
     def write_u16(self, addr: int, val: int):
-        self.write_u8(addr, (val >> 8) & 0xFF)
-        self.write_u8(addr + 1, val & 0xFF)
+        phys = addr & 0x1FFFFFFF
+        val &= 0xFFFF
+        if phys <= 0x007FFFFE:
+            self._u16.pack_into(self.rdram, phys, val)
+            if self.on_code_write:
+                self.on_code_write(phys)
+            return
+        if 0x04000000 <= phys <= 0x04000FFE:
+            self._u16.pack_into(self.sp_dmem, phys - 0x04000000, val)
+            if self.on_dmem_write:
+                self.on_dmem_write(phys - 0x04000000)
+            return
+        if 0x04001000 <= phys <= 0x04001FFE:
+            self._u16.pack_into(self.sp_imem, phys - 0x04001000, val)
+            if self.on_code_write:
+                self.on_code_write(phys)
+            return
+        # ROM and unmapped regions: ignored (slow path keeps old semantics)
+        self._write(phys, (val >> 8) & 0xFF, 1)
+        self._write((addr + 1) & 0x1FFFFFFF, val & 0xFF, 1)
 
     def write_u32(self, addr: int, val: int):
+        phys = addr & 0x1FFFFFFF
         val &= 0xFFFFFFFF
-        self.write_u8(addr, (val >> 24) & 0xFF)
-        self.write_u8(addr + 1, (val >> 16) & 0xFF)
-        self.write_u8(addr + 2, (val >> 8) & 0xFF)
-        self.write_u8(addr + 3, val & 0xFF)
+        if phys <= 0x007FFFFC:
+            self._u32.pack_into(self.rdram, phys, val)
+            if self.on_code_write:
+                self.on_code_write(phys)
+            return
+        if 0x04000000 <= phys <= 0x04000FFC:
+            self._u32.pack_into(self.sp_dmem, phys - 0x04000000, val)
+            if self.on_dmem_write:
+                self.on_dmem_write(phys - 0x04000000)
+            return
+        if 0x04001000 <= phys <= 0x04001FFC:
+            self._u32.pack_into(self.sp_imem, phys - 0x04001000, val)
+            if self.on_code_write:
+                self.on_code_write(phys)
+            return
+        for i in range(4):
+            self._write((addr + i) & 0x1FFFFFFF, (val >> (24 - 8 * i)) & 0xFF, 1)
 
     # --- Boot stub loader (IPL3) ---
 
@@ -187,13 +289,11 @@ class Memory:
         """
         if not self.rom_be or self.rom_size < 0x1000:
             return False
-        src = self.rom_be[0x40:0x1000]
-        end = min(0x1000, 0x40 + len(src))
-        # Clear DMEM
-        for i in range(0x1000):
-            self.sp_dmem[i] = 0
-        # Copy at offset 0x40
-        self.sp_dmem[0x40:end] = src[:(end - 0x40)]
+        end = min(0x1000, self.rom_size)
+        # Clear DMEM in one C-level store, then copy the stub without an
+        # intermediate bytes object by going through memoryviews.
+        self.sp_dmem[:0x1000] = bytes(0x1000)
+        memoryview(self.sp_dmem)[0x40:end] = memoryview(self.rom_be)[0x40:end]
         return True
 
 # --------------------------- CPU Core (minimal) ---------------------------
@@ -216,6 +316,96 @@ class MIPSCPU:
         self.running = False
         self.instructions = 0
         self.logger = logger
+        # Branch state for the current instruction; handlers set these and
+        # step() consumes them after dispatch.
+        self._next_pc = 0
+        self._branch_taken = False
+        self._branch_target = 0
+        self._build_dispatch_tables()
+        # Decode-once cache for SP DMEM (1024 word slots). Entries are
+        # (handler, rs, rt, rd, sa, imm, simm, target, instr) tuples; DMEM
+        # writes clear the affected slots via the Memory hook below.
+        self._decoded = [None] * 0x400
+        memory.on_dmem_write = self._on_dmem_write
+        # Fetch fast path: the boot stub lives in SP DMEM, so cache the
+        # buffer and a Struct here and skip Memory.read_u32 entirely.
+        self._dmem = memory.sp_dmem
+        self._fetch_struct = struct.Struct(">I")
+        # Direct-mapped block cache for PCs outside SP DMEM (RDRAM/IMEM/
+        # ROM): 1024 (tag_pc, decoded) slots indexed by (pc >> 2) & 0x3FF.
+        self._bcache = [(0, None)] * 0x400
+        memory.on_code_write = self._on_code_write
+
+    def _build_dispatch_tables(self):
+        """
+        Flatten the opcode decode into O(1) table dispatch: one 64-entry
+        table indexed by the top-level opcode, plus 64/32-entry sub-tables
+        for SPECIAL and REGIMM. Unassigned slots fall through to NOP,
+        preserving the old "unknown opcode is a NOP" behavior.
+        """
+        nop = self._op_nop
+        t = [nop] * 64
+        t[0x00] = self._op_special
+        t[0x01] = self._op_regimm
+        t[0x02] = self._op_j
+        t[0x03] = self._op_jal
+        t[0x04] = self._op_beq
+        t[0x05] = self._op_bne
+        t[0x06] = self._op_blez
+        t[0x07] = self._op_bgtz
+        t[0x08] = self._op_addi
+        t[0x09] = self._op_addiu
+        t[0x0A] = self._op_slti
+        t[0x0B] = self._op_sltiu
+        t[0x0C] = self._op_andi
+        t[0x0D] = self._op_ori
+        t[0x0E] = self._op_xori
+        t[0x0F] = self._op_lui
+        t[0x10] = self._op_cop0
+        t[0x20] = self._op_lb
+        t[0x21] = self._op_lh
+        t[0x23] = self._op_lw
+        t[0x24] = self._op_lbu
+        t[0x25] = self._op_lhu
+        t[0x28] = self._op_sb
+        t[0x29] = self._op_sh
+        t[0x2B] = self._op_sw
+        # 0x2F CACHE stays a NOP
+        self._op_table = t
+
+        s = [nop] * 64
+        s[0x00] = self._sp_sll
+        s[0x02] = self._sp_srl
+        s[0x03] = self._sp_sra
+        s[0x04] = self._sp_sllv
+        s[0x06] = self._sp_srlv
+        s[0x07] = self._sp_srav
+        s[0x08] = self._sp_jr
+        s[0x09] = self._sp_jalr
+        s[0x10] = self._sp_mfhi
+        s[0x11] = self._sp_mthi
+        s[0x12] = self._sp_mflo
+        s[0x13] = self._sp_mtlo
+        s[0x18] = self._sp_mult
+        s[0x19] = self._sp_multu
+        s[0x1A] = self._sp_div
+        s[0x1B] = self._sp_divu
+        s[0x21] = self._sp_addu
+        s[0x23] = self._sp_subu
+        s[0x24] = self._sp_and
+        s[0x25] = self._sp_or
+        s[0x26] = self._sp_xor
+        s[0x27] = self._sp_nor
+        s[0x2A] = self._sp_slt
+        s[0x2B] = self._sp_sltu
+        self._special_table = s
+
+        r = [nop] * 32
+        r[0x00] = self._ri_bltz
+        r[0x01] = self._ri_bgez
+        r[0x10] = self._ri_bltzal
+        r[0x11] = self._ri_bgezal
+        self._regimm_table = r
 
     def reset(self):
         self.reg = [0] * 32
@@ -227,272 +417,395 @@ class MIPSCPU:
         self.instructions = 0
 
     # --- register helpers ---
-    def _read_reg(self, i): return 0 if i == 0 else u32(self.reg[i])
+    # Invariant: every value stored in self.reg is already masked to 32
+    # bits, so reads return the raw entry with no per-call u32() wrapper.
+    def _read_reg(self, i): return self.reg[i] if i else 0
     def _write_reg(self, i, val):
-        if i != 0:
-            self.reg[i] = u32(val)
+        if i:
+            self.reg[i] = val & 0xFFFFFFFF
 
     # --- instruction fetch ---
     def _fetch(self, addr):
+        if 0xA4000000 <= addr <= 0xA4000FFC:
+            return self._fetch_struct.unpack_from(self._dmem, addr & 0xFFF)[0]
         return self.mem.read_u32(addr)
 
+    # --- decode cache ---
+    def _decode_entry(self, instr):
+        """
+        Decode one instruction word into a (handler, fields...) tuple,
+        resolving the SPECIAL/REGIMM sub-dispatch up front so cached
+        entries go straight to the final handler.
+        """
+        op = (instr >> 26) & 0x3F
+        rs = (instr >> 21) & 0x1F
+        rt = (instr >> 16) & 0x1F
+        rd = (instr >> 11) & 0x1F
+        sa = (instr >> 6) & 0x1F
+        imm = instr & 0xFFFF
+        simm = (imm ^ 0x8000) - 0x8000
+        target = instr & 0x03FFFFFF
+        if op == 0x00:
+            handler = self._special_table[instr & 0x3F]
+        elif op == 0x01:
+            handler = self._regimm_table[rt]
+        else:
+            handler = self._op_table[op]
+        return (handler, rs, rt, rd, sa, imm, simm, target, instr)
+
+    def prime_decode_cache(self, base=0xA4000040, length=0xFC0):
+        """
+        Pre-decode the boot stub in SP DMEM into the decode cache so the
+        interpreter skips fetch + field extraction for every cached PC.
+        The stub is not self-modifying, and any DMEM write invalidates
+        the touched slots anyway.
+        """
+        start = base & 0xFFF
+        pc = base
+        words = memoryview(self.mem.sp_dmem)[start:start + length]
+        for (instr,) in struct.iter_unpack(">I", words):
+            dec = self._decode_entry(instr)
+            op = (instr >> 26) & 0x3F
+            if op == 0x02 or op == 0x03:
+                # The PC is known here, so the J/JAL target is a constant;
+                # bake the absolute address into the target field and use
+                # handlers that consume it directly.
+                abs_target = ((pc + 4) & 0xF0000000) | ((instr & 0x03FFFFFF) << 2)
+                handler = self._sp_j if op == 0x02 else self._sp_jal
+                dec = (handler,) + dec[1:7] + (abs_target, instr)
+            self._decoded[(pc >> 2) & 0x3FF] = dec
+            pc += 4
+
+    def _on_dmem_write(self, offset):
+        # A write may straddle two word slots; clear both.
+        self._decoded[(offset >> 2) & 0x3FF] = None
+        self._decoded[((offset + 3) >> 2) & 0x3FF] = None
+
+    def _on_code_write(self, phys):
+        # KSEG0/KSEG1 map linearly, so the low PC bits match the physical
+        # bits and the written word's slot can be dropped directly.
+        self._bcache[(phys >> 2) & 0x3FF] = (0, None)
+        self._bcache[((phys + 3) >> 2) & 0x3FF] = (0, None)
+
     # --- execution ---
     def step(self):
         if not self.running:
             return
         pc = self.pc
-        instr = self._fetch(pc)
-
-        # Defaults
-        next_pc = u32(pc + 4)
-        branch_taken = False
-        branch_target = 0
-
-        op = bits(instr, 26, 31)
-        rs = bits(instr, 21, 25)
-        rt = bits(instr, 16, 20)
-        rd = bits(instr, 11, 15)
-        sa = bits(instr, 6, 10)
-        fn = bits(instr, 0, 5)
-        imm = bits(instr, 0, 15)
-        simm = sext16(imm)
-        target = bits(instr, 0, 25)
-
-        def do_load(addr, size):
-            if size == 1: return self.mem.read_u8(addr)
-            if size == 2: return self.mem.read_u16(addr)
-            return self.mem.read_u32(addr)
-
-        def do_store(addr, val, size):
-            if size == 1: self.mem.write_u8(addr, val)
-            elif size == 2: self.mem.write_u16(addr, val)
-            else: self.mem.write_u32(addr, val)
-
-        # --- Decode ---
-        if op == 0x00:  # SPECIAL
-            if fn == 0x00:  # SLL
-                self._write_reg(rd, (self._read_reg(rt) << sa) & 0xFFFFFFFF)
-            elif fn == 0x02:  # SRL
-                self._write_reg(rd, (self._read_reg(rt) >> sa) & 0xFFFFFFFF)
-            elif fn == 0x03:  # SRA
-                self._write_reg(rd, u32(s32(self._read_reg(rt)) >> sa))
-            elif fn == 0x04:  # SLLV
-                self._write_reg(rd, u32(self._read_reg(rt) << (self._read_reg(rs) & 31)))
-            elif fn == 0x06:  # SRLV
-                self._write_reg(rd, u32(self._read_reg(rt) >> (self._read_reg(rs) & 31)))
-            elif fn == 0x07:  # SRAV
-                self._write_reg(rd, u32(s32(self._read_reg(rt)) >> (self._read_reg(rs) & 31)))
-            elif fn == 0x08:  # JR
-                branch_taken = True
-                branch_target = u32(self._read_reg(rs))
-            elif fn == 0x09:  # JALR
-                self._write_reg(rd if rd != 0 else 31, next_pc)
-                branch_taken = True
-                branch_target = u32(self._read_reg(rs))
-            elif fn == 0x10:  # MFHI
-                self._write_reg(rd, self.hi)
-            elif fn == 0x12:  # MFLO
-                self._write_reg(rd, self.lo)
-            elif fn == 0x11:  # MTHI
-                self.hi = self._read_reg(rs)
-            elif fn == 0x13:  # MTLO
-                self.lo = self._read_reg(rs)
-            elif fn == 0x18:  # MULT
-                self._do_mult(self._read_reg(rs), self._read_reg(rt), signed=True)
-            elif fn == 0x19:  # MULTU
-                self._do_mult(self._read_reg(rs), self._read_reg(rt), signed=False)
-            elif fn == 0x1A:  # DIV
-                self._do_div(self._read_reg(rs), self._read_reg(rt), signed=True)
-            elif fn == 0x1B:  # DIVU
-                self._do_div(self._read_reg(rs), self._read_reg(rt), signed=False)
-            elif fn == 0x21:  # ADDU
-                self._write_reg(rd, self._read_reg(rs) + self._read_reg(rt))
-            elif fn == 0x23:  # SUBU
-                self._write_reg(rd, self._read_reg(rs) - self._read_reg(rt))
-            elif fn == 0x24:  # AND
-                self._write_reg(rd, self._read_reg(rs) & self._read_reg(rt))
-            elif fn == 0x25:  # OR
-                self._write_reg(rd, self._read_reg(rs) | self._read_reg(rt))
-            elif fn == 0x26:  # XOR
-                self._write_reg(rd, self._read_reg(rs) ^ self._read_reg(rt))
-            elif fn == 0x27:  # NOR
-                self._write_reg(rd, u32(~(self._read_reg(rs) | self._read_reg(rt))))
-            elif fn == 0x2A:  # SLT
-                self._write_reg(rd, 1 if s32(self._read_reg(rs)) < s32(self._read_reg(rt)) else 0)
-            elif fn == 0x2B:  # SLTU
-                self._write_reg(rd, 1 if self._read_reg(rs) < self._read_reg(rt) else 0)
+
+        self._next_pc = next_pc = (pc + 4) & 0xFFFFFFFF
+        self._branch_taken = False
+
+        slot = (pc >> 2) & 0x3FF
+        if 0xA4000000 <= pc < 0xA4001000:
+            dec = self._decoded[slot]
+            if dec is None:
+                dec = self._decode_entry(self._fetch(pc))
+        else:
+            cached_pc, dec = self._bcache[slot]
+            if cached_pc != pc or dec is None:
+                dec = self._decode_entry(self._fetch(pc))
+                self._bcache[slot] = (pc, dec)
+        handler, rs, rt, rd, sa, imm, simm, target, instr = dec
+        handler(rs, rt, rd, sa, imm, simm, target, instr)
+
+        # Execute branch delay slot
+        if self._branch_taken:
+            branch_target = self._branch_target
+            self._branch_taken = False
+            self._exec_delay(next_pc)
+            self.pc = branch_target & 0xFFFFFFFF
+        else:
+            self.pc = next_pc
+
+        self.instructions += 1
+
+    def run_block(self, max_steps=10000):
+        """
+        Execute up to max_steps instructions in one tight loop, keeping PC
+        and the hot lookups in locals instead of paying per-step attribute
+        traffic through step(). Branches still go through the same delay
+        slot handling as step(). Returns the number of instructions run.
+        """
+        if not self.running:
+            return 0
+        decoded = self._decoded
+        bcache = self._bcache
+        decode_entry = self._decode_entry
+        fetch = self._fetch
+        pc = self.pc
+        executed = 0
+        while executed < max_steps and self.running:
+            self._next_pc = next_pc = (pc + 4) & 0xFFFFFFFF
+            self._branch_taken = False
+
+            slot = (pc >> 2) & 0x3FF
+            if 0xA4000000 <= pc < 0xA4001000:
+                dec = decoded[slot]
+                if dec is None:
+                    dec = decode_entry(fetch(pc))
             else:
-                # Unimplemented SPECIAL -> NOP
-                pass
-
-        elif op == 0x01:  # REGIMM
-            rtcode = rt
-            cmp = s32(self._read_reg(rs))
-            if rtcode == 0x00:  # BLTZ
-                if cmp < 0: branch_taken = True; branch_target = u32(next_pc + (simm << 2))
-            elif rtcode == 0x01:  # BGEZ
-                if cmp >= 0: branch_taken = True; branch_target = u32(next_pc + (simm << 2))
-            elif rtcode == 0x10:  # BLTZAL
-                if cmp < 0:
-                    self._write_reg(31, next_pc)
-                    branch_taken = True; branch_target = u32(next_pc + (simm << 2))
-            elif rtcode == 0x11:  # BGEZAL
-                if cmp >= 0:
-                    self._write_reg(31, next_pc)
-                    branch_taken = True; branch_target = u32(next_pc + (simm << 2))
+                cached_pc, dec = bcache[slot]
+                if cached_pc != pc or dec is None:
+                    dec = decode_entry(fetch(pc))
+                    bcache[slot] = (pc, dec)
+            handler, rs, rt, rd, sa, imm, simm, target, instr = dec
+            handler(rs, rt, rd, sa, imm, simm, target, instr)
+
+            if self._branch_taken:
+                branch_target = self._branch_target
+                self._branch_taken = False
+                self._exec_delay(next_pc)
+                pc = branch_target & 0xFFFFFFFF
             else:
-                pass
+                pc = next_pc
+            executed += 1
 
-        elif op == 0x02:  # J
-            branch_taken = True
-            branch_target = u32((next_pc & 0xF0000000) | (target << 2))
+        self.pc = pc
+        self.instructions += executed
+        return executed
 
-        elif op == 0x03:  # JAL
-            self._write_reg(31, next_pc)
-            branch_taken = True
-            branch_target = u32((next_pc & 0xF0000000) | (target << 2))
+    # --- dispatch handlers ---
+    # All handlers share one pre-decoded field signature so the tables can
+    # call them uniformly; most ignore the fields they do not use.
 
-        elif op == 0x04:  # BEQ
-            if self._read_reg(rs) == self._read_reg(rt):
-                branch_taken = True; branch_target = u32(next_pc + (simm << 2))
+    def _op_nop(self, rs, rt, rd, sa, imm, simm, target, instr):
+        pass
 
-        elif op == 0x05:  # BNE
-            if self._read_reg(rs) != self._read_reg(rt):
-                branch_taken = True; branch_target = u32(next_pc + (simm << 2))
+    def _branch_to(self, addr):
+        self._branch_taken = True
+        self._branch_target = addr & 0xFFFFFFFF
 
-        elif op == 0x06:  # BLEZ
-            if s32(self._read_reg(rs)) <= 0:
-                branch_taken = True; branch_target = u32(next_pc + (simm << 2))
+    def _op_special(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._special_table[instr & 0x3F](rs, rt, rd, sa, imm, simm, target, instr)
 
-        elif op == 0x07:  # BGTZ
-            if s32(self._read_reg(rs)) > 0:
-                branch_taken = True; branch_target = u32(next_pc + (simm << 2))
+    def _op_regimm(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._regimm_table[rt](rs, rt, rd, sa, imm, simm, target, instr)
 
-        elif op == 0x08:  # ADDI
-            self._write_reg(rt, u32(self._read_reg(rs) + simm))
+    # SPECIAL
+    def _sp_sll(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, (self._read_reg(rt) << sa) & 0xFFFFFFFF)
 
-        elif op == 0x09:  # ADDIU
-            self._write_reg(rt, u32(self._read_reg(rs) + simm))
+    def _sp_srl(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, (self._read_reg(rt) >> sa) & 0xFFFFFFFF)
 
-        elif op == 0x0A:  # SLTI
-            self._write_reg(rt, 1 if s32(self._read_reg(rs)) < simm else 0)
+    def _sp_sra(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, u32(s32(self._read_reg(rt)) >> sa))
 
-        elif op == 0x0B:  # SLTIU
-            self._write_reg(rt, 1 if self._read_reg(rs) < u32(simm) else 0)
+    def _sp_sllv(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, u32(self._read_reg(rt) << (self._read_reg(rs) & 31)))
 
-        elif op == 0x0C:  # ANDI
-            self._write_reg(rt, self._read_reg(rs) & (imm))
+    def _sp_srlv(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, u32(self._read_reg(rt) >> (self._read_reg(rs) & 31)))
 
-        elif op == 0x0D:  # ORI
-            self._write_reg(rt, self._read_reg(rs) | (imm))
+    def _sp_srav(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, u32(s32(self._read_reg(rt)) >> (self._read_reg(rs) & 31)))
 
-        elif op == 0x0E:  # XORI
-            self._write_reg(rt, self._read_reg(rs) ^ (imm))
+    def _sp_jr(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._branch_to(self._read_reg(rs))
 
-        elif op == 0x0F:  # LUI
-            self._write_reg(rt, (imm << 16))
+    def _sp_jalr(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd if rd != 0 else 31, self._next_pc)
+        self._branch_to(self._read_reg(rs))
 
-        elif op == 0x10:  # COP0
-            rs_co = bits(instr, 21, 25)
-            if rs_co == 0x00:  # MFC0
-                self._write_reg(rt, self.cp0[rd])
-            elif rs_co == 0x04:  # MTC0
-                self.cp0[rd] = self._read_reg(rt)
-            else:
-                # TLB ops or others -> NOP
-                pass
-
-        elif op == 0x20:  # LB
-            addr = u32(self._read_reg(rs) + simm)
-            val = self.mem.read_u8(addr)
-            self._write_reg(rt, u32(sign16(val if val < 0x80 else val - 0x100)))
-        elif op == 0x21:  # LH
-            addr = u32(self._read_reg(rs) + simm)
-            val = self.mem.read_u16(addr)
-            self._write_reg(rt, u32(sign16(val)))
-        elif op == 0x23:  # LW
-            addr = u32(self._read_reg(rs) + simm)
-            self._write_reg(rt, self.mem.read_u32(addr))
-        elif op == 0x24:  # LBU
-            addr = u32(self._read_reg(rs) + simm)
-            self._write_reg(rt, self.mem.read_u8(addr))
-        elif op == 0x25:  # LHU
-            addr = u32(self._read_reg(rs) + simm)
-            self._write_reg(rt, self.mem.read_u16(addr))
-        elif op == 0x28:  # SB
-            addr = u32(self._read_reg(rs) + simm)
-            self.mem.write_u8(addr, self._read_reg(rt))
-        elif op == 0x29:  # SH
-            addr = u32(self._read_reg(rs) + simm)
-            self.mem.write_u16(addr, self._read_reg(rt))
-        elif op == 0x2B:  # SW
-            addr = u32(self._read_reg(rs) + simm)
-            self.mem.write_u32(addr, self._read_reg(rt))
-
-        elif op == 0x2F:  # CACHE (stub: ignore)
-            pass
+    def _sp_mfhi(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, self.hi)
 
-        else:
-            # Unimplemented top-level opcode -> NOP
-            pass
+    def _sp_mthi(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self.hi = self._read_reg(rs)
 
-        # Execute branch delay slot
-        if branch_taken:
-            delay_instr = self._fetch(next_pc)
-            self._exec_delay_slot(delay_instr)
-            self.pc = u32(branch_target)
-        else:
-            self.pc = next_pc
+    def _sp_mflo(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, self.lo)
 
-        self.instructions += 1
+    def _sp_mtlo(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self.lo = self._read_reg(rs)
 
-    def _exec_delay_slot(self, instr):
-        # Minimal: reuse decoder for a subset; ignore nested branches inside delay slot for simplicity.
-        op = bits(instr, 26, 31)
-        rs = bits(instr, 21, 25)
-        rt = bits(instr, 16, 20)
-        rd = bits(instr, 11, 15)
-        sa = bits(instr, 6, 10)
-        fn = bits(instr, 0, 5)
-        imm = bits(instr, 0, 15)
-        simm = sext16(imm)
-
-        if op == 0x00 and fn == 0x21:   # ADDU
-            self._write_reg(rd, self._read_reg(rs) + self._read_reg(rt))
-        elif op == 0x00 and fn == 0x25: # OR
-            self._write_reg(rd, self._read_reg(rs) | self._read_reg(rt))
-        elif op == 0x0D:                # ORI
-            self._write_reg(rt, self._read_reg(rs) | imm)
-        elif op == 0x0F:                # LUI
-            self._write_reg(rt, (imm << 16))
-        elif op == 0x23:                # LW
-            addr = u32(self._read_reg(rs) + simm)
-            self._write_reg(rt, self.mem.read_u32(addr))
-        elif op == 0x2B:                # SW
-            addr = u32(self._read_reg(rs) + simm)
-            self.mem.write_u32(addr, self._read_reg(rt))
-        else:
-            # Treat any other delay-slot op as NOP for safety
-            pass
+    # MULT/DIV come in fully specialized signed/unsigned flavors so the
+    # dispatched handler has no runtime-constant `if signed:` branch.
+    def _sp_mult(self, rs, rt, rd, sa, imm, simm, target, instr):
+        res = s32(self._read_reg(rs)) * s32(self._read_reg(rt))
+        self.hi = (res >> 32) & 0xFFFFFFFF
+        self.lo = res & 0xFFFFFFFF
 
-    def _do_mult(self, a, b, signed=True):
-        if signed:
-            res = s32(a) * s32(b)
-        else:
-            res = (a & 0xFFFFFFFF) * (b & 0xFFFFFFFF)
-        self.hi = u32((res >> 32) & 0xFFFFFFFF)
-        self.lo = u32(res & 0xFFFFFFFF)
+    def _sp_multu(self, rs, rt, rd, sa, imm, simm, target, instr):
+        res = self._read_reg(rs) * self._read_reg(rt)
+        self.hi = (res >> 32) & 0xFFFFFFFF
+        self.lo = res & 0xFFFFFFFF
 
-    def _do_div(self, a, b, signed=True):
+    def _sp_div(self, rs, rt, rd, sa, imm, simm, target, instr):
+        b = s32(self._read_reg(rt))
         if b == 0:
             # MIPS leaves HI/LO undefined; keep previous values.
             return
-        if signed:
-            self.lo = u32(int(s32(a) / s32(b)))
-            self.hi = u32(int(s32(a) % s32(b)))
-        else:
-            self.lo = u32((a & 0xFFFFFFFF) // (b & 0xFFFFFFFF))
-            self.hi = u32((a & 0xFFFFFFFF) % (b & 0xFFFFFFFF))
+        a = s32(self._read_reg(rs))
+        self.lo = u32(int(a / b))
+        self.hi = u32(int(a % b))
+
+    def _sp_divu(self, rs, rt, rd, sa, imm, simm, target, instr):
+        b = self._read_reg(rt)
+        if b == 0:
+            return
+        a = self._read_reg(rs)
+        self.lo = a // b
+        self.hi = a % b
+
+    def _sp_addu(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, self._read_reg(rs) + self._read_reg(rt))
+
+    def _sp_subu(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, self._read_reg(rs) - self._read_reg(rt))
+
+    def _sp_and(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, self._read_reg(rs) & self._read_reg(rt))
+
+    def _sp_or(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, self._read_reg(rs) | self._read_reg(rt))
+
+    def _sp_xor(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, self._read_reg(rs) ^ self._read_reg(rt))
+
+    def _sp_nor(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, u32(~(self._read_reg(rs) | self._read_reg(rt))))
+
+    def _sp_slt(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, 1 if s32(self._read_reg(rs)) < s32(self._read_reg(rt)) else 0)
+
+    def _sp_sltu(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rd, 1 if self._read_reg(rs) < self._read_reg(rt) else 0)
+
+    # REGIMM
+    def _ri_bltz(self, rs, rt, rd, sa, imm, simm, target, instr):
+        if s32(self._read_reg(rs)) < 0:
+            self._branch_to(self._next_pc + (simm << 2))
+
+    def _ri_bgez(self, rs, rt, rd, sa, imm, simm, target, instr):
+        if s32(self._read_reg(rs)) >= 0:
+            self._branch_to(self._next_pc + (simm << 2))
+
+    def _ri_bltzal(self, rs, rt, rd, sa, imm, simm, target, instr):
+        if s32(self._read_reg(rs)) < 0:
+            self._write_reg(31, self._next_pc)
+            self._branch_to(self._next_pc + (simm << 2))
+
+    def _ri_bgezal(self, rs, rt, rd, sa, imm, simm, target, instr):
+        if s32(self._read_reg(rs)) >= 0:
+            self._write_reg(31, self._next_pc)
+            self._branch_to(self._next_pc + (simm << 2))
+
+    # Jumps and branches
+    def _op_j(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._branch_to((self._next_pc & 0xF0000000) | (target << 2))
+
+    def _op_jal(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(31, self._next_pc)
+        self._branch_to((self._next_pc & 0xF0000000) | (target << 2))
+
+    # Primed variants used by prime_decode_cache: target already holds the
+    # final absolute address, so no shift/OR/mask per execution.
+    def _sp_j(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._branch_taken = True
+        self._branch_target = target
+
+    def _sp_jal(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(31, self._next_pc)
+        self._branch_taken = True
+        self._branch_target = target
+
+    def _op_beq(self, rs, rt, rd, sa, imm, simm, target, instr):
+        if self._read_reg(rs) == self._read_reg(rt):
+            self._branch_to(self._next_pc + (simm << 2))
+
+    def _op_bne(self, rs, rt, rd, sa, imm, simm, target, instr):
+        if self._read_reg(rs) != self._read_reg(rt):
+            self._branch_to(self._next_pc + (simm << 2))
+
+    def _op_blez(self, rs, rt, rd, sa, imm, simm, target, instr):
+        if s32(self._read_reg(rs)) <= 0:
+            self._branch_to(self._next_pc + (simm << 2))
+
+    def _op_bgtz(self, rs, rt, rd, sa, imm, simm, target, instr):
+        if s32(self._read_reg(rs)) > 0:
+            self._branch_to(self._next_pc + (simm << 2))
+
+    # ALU immediates
+    def _op_addi(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rt, u32(self._read_reg(rs) + simm))
+
+    def _op_addiu(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rt, u32(self._read_reg(rs) + simm))
+
+    def _op_slti(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rt, 1 if s32(self._read_reg(rs)) < simm else 0)
+
+    def _op_sltiu(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rt, 1 if self._read_reg(rs) < u32(simm) else 0)
+
+    def _op_andi(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rt, self._read_reg(rs) & imm)
+
+    def _op_ori(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rt, self._read_reg(rs) | imm)
+
+    def _op_xori(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rt, self._read_reg(rs) ^ imm)
+
+    def _op_lui(self, rs, rt, rd, sa, imm, simm, target, instr):
+        self._write_reg(rt, imm << 16)
+
+    def _op_cop0(self, rs, rt, rd, sa, imm, simm, target, instr):
+        if rs == 0x00:  # MFC0
+            self._write_reg(rt, self.cp0[rd])
+        elif rs == 0x04:  # MTC0
+            self.cp0[rd] = self._read_reg(rt)
+        # TLB ops or others -> NOP
+
+    # Loads/stores
+    def _op_lb(self, rs, rt, rd, sa, imm, simm, target, instr):
+        addr = u32(self._read_reg(rs) + simm)
+        val = self.mem.read_u8(addr)
+        self._write_reg(rt, ((val ^ 0x80) - 0x80) & 0xFFFFFFFF)
+
+    def _op_lh(self, rs, rt, rd, sa, imm, simm, target, instr):
+        addr = u32(self._read_reg(rs) + simm)
+        val = self.mem.read_u16(addr)
+        self._write_reg(rt, ((val ^ 0x8000) - 0x8000) & 0xFFFFFFFF)
+
+    def _op_lw(self, rs, rt, rd, sa, imm, simm, target, instr):
+        addr = u32(self._read_reg(rs) + simm)
+        self._write_reg(rt, self.mem.read_u32(addr))
+
+    def _op_lbu(self, rs, rt, rd, sa, imm, simm, target, instr):
+        addr = u32(self._read_reg(rs) + simm)
+        self._write_reg(rt, self.mem.read_u8(addr))
+
+    def _op_lhu(self, rs, rt, rd, sa, imm, simm, target, instr):
+        addr = u32(self._read_reg(rs) + simm)
+        self._write_reg(rt, self.mem.read_u16(addr))
+
+    def _op_sb(self, rs, rt, rd, sa, imm, simm, target, instr):
+        addr = u32(self._read_reg(rs) + simm)
+        self.mem.write_u8(addr, self._read_reg(rt))
+
+    def _op_sh(self, rs, rt, rd, sa, imm, simm, target, instr):
+        addr = u32(self._read_reg(rs) + simm)
+        self.mem.write_u16(addr, self._read_reg(rt))
+
+    def _op_sw(self, rs, rt, rd, sa, imm, simm, target, instr):
+        addr = u32(self._read_reg(rs) + simm)
+        self.mem.write_u32(addr, self._read_reg(rt))
+
+    def _exec_delay(self, addr):
+        """
+        Execute the branch delay slot through the normal dispatch path, so
+        every implemented opcode works in a delay slot. Any branch the
+        delay instruction itself requests is discarded — nested branches
+        in delay slots are architecturally undefined on MIPS.
+        """
+        dec = self._decoded[(addr >> 2) & 0x3FF] if 0xA4000000 <= addr < 0xA4001000 else None
+        if dec is None:
+            dec = self._decode_entry(self._fetch(addr))
+        handler, rs, rt, rd, sa, imm, simm, target, instr = dec
+        handler(rs, rt, rd, sa, imm, simm, target, instr)
 
 # --------------------------- Graphics (stub) ---------------------------
 
@@ -510,34 +823,51 @@ class VideoInterface:
         self.frame_count = 0
         self.mode = "fast3d"
         self.fast3d = Fast3DStub()
-
-    def render_frame(self, cpu_state, rom_info=None):
-        self.canvas.delete("all")
+        # Persistent canvas items: created once here, mutated per frame
+        # via coords/itemconfig. Tk updates an existing item far cheaper
+        # than a delete("all") + recreate cycle.
         screen_x, screen_y = 192, 114
-        self.canvas.create_rectangle(screen_x, screen_y, screen_x + 640, screen_y + 480,
-                                     fill="#000000", outline="#00ff88", width=2)
+        self._bg_id = canvas.create_rectangle(
+            screen_x, screen_y, screen_x + 640, screen_y + 480,
+            fill="#000000", outline="#00ff88", width=2)
+        self._tri_id = canvas.create_polygon(
+            0, 0, 0, 0, 0, 0, fill="#ff0000", outline="white", state="hidden")
+        self._title_id = canvas.create_text(
+            512, 150, text="Fast3D Triangle Stub",
+            font=("Arial", 18), fill="#00ff88", state="hidden")
+        self._hud_id = canvas.create_text(
+            16, 16, text="", font=("Consolas", 10), anchor="nw", fill="#d0ffd0")
+        # One %-format template built once; per frame the register line is
+        # a single C-level format call instead of 8 f-strings plus a join.
+        self._reg_fmt = "Regs: " + " ".join(f"r{i}=%08X" for i in range(8))
 
+    def render_frame(self, cpu_state, rom_info=None):
+        canvas = self.canvas
         if self.mode == "fast3d":
             self.fast3d.step()
-            for tri in self.fast3d.triangles:
-                self.canvas.create_polygon(tri, fill="#ff0000", outline="white")
-
-            self.canvas.create_text(512, 150, text="Fast3D Triangle Stub",
-                                    font=("Arial", 18), fill="#00ff88")
-
-        # Overlay CPU + ROM info
-        text_lines = [
-            f"PC: 0x{cpu_state['pc']:08X}    Instr#: {cpu_state['instructions']}",
-            "Regs: " + " ".join([f"r{i}={cpu_state['regs'][i]:08X}" for i in range(8)]),
-        ]
-        if rom_info:
-            text_lines += [
-                f"ROM: {rom_info.get('name','?')}  ID: {rom_info.get('game_id','??')}  Region: {rom_info.get('region','?')}",
-                f"CRC1: {rom_info.get('crc1','0'):08X}  CRC2: {rom_info.get('crc2','0'):08X}"
+            tris = self.fast3d.triangles
+            if tris:
+                flat = [c for pt in tris[0] for c in pt]
+                canvas.coords(self._tri_id, *flat)
+                canvas.itemconfig(self._tri_id, state="normal")
+                canvas.itemconfig(self._title_id, state="normal")
+            else:
+                canvas.itemconfig(self._tri_id, state="hidden")
+                canvas.itemconfig(self._title_id, state="hidden")
+
+        # Overlay CPU + ROM info. Rebuilding the string every frame is
+        # wasted work, so refresh the HUD only every few frames.
+        if self.frame_count % 4 == 0:
+            text_lines = [
+                f"PC: 0x{cpu_state['pc']:08X}    Instr#: {cpu_state['instructions']}",
+                self._reg_fmt % tuple(cpu_state['regs'][:8]),
             ]
-
-        self.canvas.create_text(16, 16, text="\n".join(text_lines),
-                                font=("Consolas", 10), anchor="nw", fill="#d0ffd0")
+            if rom_info:
+                text_lines += [
+                    f"ROM: {rom_info.get('name','?')}  ID: {rom_info.get('game_id','??')}  Region: {rom_info.get('region','?')}",
+                    f"CRC1: {rom_info.get('crc1','0'):08X}  CRC2: {rom_info.get('crc2','0'):08X}"
+                ]
+            canvas.itemconfig(self._hud_id, text="\n".join(text_lines))
         self.frame_count += 1
 
 # --------------------------- Emulator Shell ---------------------------
@@ -553,6 +883,11 @@ class MIPSEMU:
         self.video = VideoInterface(self.canvas)
         self.running = False
         self.rom_header = None
+        # Instructions executed per scheduler yield in emu_loop.
+        self.batch_size = 10_000
+        # Instruction count at the last rendered frame; render_loop skips
+        # redraws while the CPU has made no progress.
+        self._last_rendered_instrs = -1
 
         # Controls
         ctrl = tk.Frame(root)
@@ -581,6 +916,7 @@ class MIPSEMU:
 
         self.rom_header = ROMHeader(be)
         self.cpu.reset()
+        self.cpu.prime_decode_cache()
         self.log(f"ROM loaded: {self.rom_header.name} ({self.rom_header.game_id}) region={self.rom_header.region}")
         self.log(f"CRC1={self.rom_header.crc1:08X} CRC2={self.rom_header.crc2:08X}")
         self.log("Boot stub copied to SP DMEM @ 0xA4000040. PC set to 0xA4000040.")
@@ -619,10 +955,13 @@ class MIPSEMU:
 
     def emu_loop(self):
         try:
+            run_block = self.cpu.run_block
+            batch = self.batch_size
             while self.running and self.cpu.running:
-                self.cpu.step()
-                # ~1.5 MHz-ish toy speed, not real-time
-                time.sleep(0.0006)
+                run_block(batch)
+                # Yield between batches, not per instruction; throughput is
+                # governed by batch size rather than timer granularity.
+                time.sleep(0.006)
         except Exception as e:
             self.log(f"CPU Exception at PC=0x{self.cpu.pc:08X}: {e}")
             self.cpu.running = False
@@ -643,8 +982,12 @@ class MIPSEMU:
 
     def render_loop(self):
         if self.running:
-            self.render_once()
-            # ~60Hz UI refresh
+            instrs = self.cpu.instructions
+            if instrs != self._last_rendered_instrs:
+                self._last_rendered_instrs = instrs
+                self.render_once()
+            # ~60Hz UI refresh; rescheduling without a redraw is cheap, so
+            # keep the tick alive even while the CPU is idle.
             self.root.after(16, self.render_loop)
 
 # --------------------------- Main ---------------------------
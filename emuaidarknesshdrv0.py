@@ -7,9 +7,13 @@ Python 3.13 | Tkinter GUI
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import os, struct, json, time, threading
-from pathlib import Path
-from datetime import datetime
+import os, struct, json, mmap, time, threading
+from array import array
+from collections import deque
+
+# Compiled once at import; struct.unpack with a literal format string
+# reparses the format on every call.
+_U32_BE = struct.Struct('>I')
 
 
 # ---------------- ROM Header ----------------
@@ -20,7 +24,7 @@ class ROMHeader:
         self.parse()
 
     def parse(self):
-        magic = struct.unpack('>I', self.raw_data[0:4])[0]
+        magic = _U32_BE.unpack_from(self.raw_data, 0)[0]
         if magic == 0x80371240:
             self.endian = 'big'
         elif magic == 0x40123780:
@@ -32,26 +36,30 @@ class ROMHeader:
         else:
             self.endian = 'unknown'
 
-        self.clock_rate = struct.unpack('>I', self.raw_data[0x04:0x08])[0]
-        self.boot_address = struct.unpack('>I', self.raw_data[0x08:0x0C])[0]
-        self.release = struct.unpack('>I', self.raw_data[0x0C:0x10])[0]
-        self.crc1 = struct.unpack('>I', self.raw_data[0x10:0x14])[0]
-        self.crc2 = struct.unpack('>I', self.raw_data[0x14:0x18])[0]
+        self.clock_rate = _U32_BE.unpack_from(self.raw_data, 0x04)[0]
+        self.boot_address = _U32_BE.unpack_from(self.raw_data, 0x08)[0]
+        self.release = _U32_BE.unpack_from(self.raw_data, 0x0C)[0]
+        self.crc1 = _U32_BE.unpack_from(self.raw_data, 0x10)[0]
+        self.crc2 = _U32_BE.unpack_from(self.raw_data, 0x14)[0]
         self.name = self.raw_data[0x20:0x34].decode('ascii', errors='ignore').strip('\x00')
         self.game_id = self.raw_data[0x3B:0x3F].decode('ascii', errors='ignore')
         self.cart_id = chr(self.raw_data[0x3F])
 
-    def swap_endian_n64(self, data):
-        result = bytearray(len(data))
-        for i in range(0, len(data), 4):
-            result[i:i+4] = data[i:i+4][::-1]
-        return bytes(result)
+    @staticmethod
+    def swap_endian_n64(data):
+        # Bulk 4-byte reversal via array.byteswap (C loop, not per-chunk
+        # Python slicing); usable on whole ROM images, not just headers.
+        cut = len(data) & ~3
+        arr = array('I', data[:cut])
+        arr.byteswap()
+        return arr.tobytes() + bytes(data[cut:])
 
-    def swap_endian_v64(self, data):
-        result = bytearray(len(data))
-        for i in range(0, len(data), 2):
-            result[i] = data[i+1]; result[i+1] = data[i]
-        return bytes(result)
+    @staticmethod
+    def swap_endian_v64(data):
+        cut = len(data) & ~1
+        arr = array('H', data[:cut])
+        arr.byteswap()
+        return arr.tobytes() + bytes(data[cut:])
 
 
 # ---------------- CPU Core ----------------
@@ -60,49 +68,129 @@ class MIPSCPU:
     def __init__(self, memory):
         self.memory = memory
         self.pc = 0xA4000040
-        self.registers = [0] * 32
+        # Typed flat buffer: no per-slot boxed ints, and slices stay
+        # compact typed arrays instead of fresh lists of PyLongs.
+        self.registers = array('I', [0] * 32)
         self.hi = 0; self.lo = 0
         self.running = False
         self.instructions_executed = 0
+        # Decoded fields keyed by physical word index; hot loops decode
+        # each instruction once. Writes into RDRAM invalidate their slot.
+        self.decode_cache = {}
+        memory.on_code_write = self._invalidate_code
+        # Frozen 64-entry handler table keyed by the primary opcode;
+        # tuple indexing is a single bytecode op, against six-plus for a
+        # dict lookup. Missing op_xx methods fall back to op_reserved.
+        self._dispatch = tuple(getattr(self, f'op_{i:02x}', self.op_reserved)
+                               for i in range(64))
 
     def reset(self):
         self.pc = 0xA4000040
-        self.registers = [0]*32
+        self.registers = array('I', [0] * 32)
         self.hi = self.lo = 0
         self.instructions_executed = 0
+        self.decode_cache.clear()
+
+    def decode(self, instr):
+        """Split an instruction word into its fixed fields once."""
+        return ((instr >> 26) & 0x3F,
+                (instr >> 21) & 0x1F,
+                (instr >> 16) & 0x1F,
+                (instr >> 11) & 0x1F,
+                instr & 0xFFFF)
+
+    def _invalidate_code(self, addr):
+        # A word write lands on exactly one decoded slot.
+        self.decode_cache.pop(addr >> 2, None)
+
+    def op_reserved(self, rs, rt, rd, imm):
+        # Stub handler; real op_xx implementations take its table slot
+        # automatically as they are added.
+        pass
 
     def step(self):
         if not self.running: return
         try:
-            instr = self.memory.read_word(self.pc)
-            # Stub decode (expand later)
+            key = (self.pc & 0x1FFFFFFF) >> 2
+            fields = self.decode_cache.get(key)
+            if fields is None:
+                fields = self.decode_cache[key] = self.decode(self.memory.read_word(self.pc))
+            op, rs, rt, rd, imm = fields
+            self._dispatch[op](rs, rt, rd, imm)
             self.pc += 4
             self.instructions_executed += 1
         except Exception as e:
             print(f"CPU Exception at {hex(self.pc)}: {e}")
             self.running = False
 
+    def run_block(self, n: int) -> int:
+        """Execute up to n instructions as one batch.
+
+        The fetch loop runs with its hot lookups bound to locals, so
+        attribute traffic and the Python call overhead of step() are paid
+        once per batch rather than once per instruction.
+        """
+        if not self.running:
+            return 0
+        read_word = self.memory.read_word
+        cache = self.decode_cache
+        decode = self.decode
+        dispatch = self._dispatch
+        pc = self.pc
+        executed = 0
+        try:
+            while executed < n:
+                key = (pc & 0x1FFFFFFF) >> 2
+                fields = cache.get(key)
+                if fields is None:
+                    fields = cache[key] = decode(read_word(pc))
+                op, rs, rt, rd, imm = fields
+                dispatch[op](rs, rt, rd, imm)
+                pc = (pc + 4) & 0xFFFFFFFF
+                executed += 1
+        except Exception as e:
+            print(f"CPU Exception at {hex(pc)}: {e}")
+            self.running = False
+        self.pc = pc
+        self.instructions_executed += executed
+        return executed
+
 
 # ---------------- Memory ----------------
 class Memory:
     def __init__(self):
         self.rdram = bytearray(8*1024*1024)
         self.rom = None; self.rom_size = 0
-    def load_rom(self, rom_data: bytes):
+        self._u32 = _U32_BE  # instance alias keeps the hot path a self-lookup
+        self._rdram_top = len(self.rdram) - 4  # last word-aligned offset
+        self.on_code_write = None  # CPU hook: invalidate decoded slots
+    def load_rom(self, rom_data, endian: str = 'big'):
+        # Normalize to big-endian once here so read_word never has to care
+        # about the source byte order. rom_data may be an mmap; it is only
+        # copied when a byte-order conversion is actually required.
+        if endian == 'little':
+            rom_data = ROMHeader.swap_endian_n64(rom_data)
+        elif endian == 'byteswap':
+            rom_data = ROMHeader.swap_endian_v64(rom_data)
         self.rom = rom_data; self.rom_size = len(rom_data)
     def read_word(self, addr:int) -> int:
-        addr &= 0xFFFFFFFF
-        if (0x10000000 <= addr < 0x1FBFFFFF) and self.rom:
-            rom_addr = addr & 0x0FFFFFFF
+        # RDRAM first: nearly all loads (fetch, stack, heap) land there,
+        # so strip the KSEG bits and settle the common case with one
+        # compare before considering the ROM window.
+        phys = addr & 0x1FFFFFFF
+        if phys <= self._rdram_top:
+            return self._u32.unpack_from(self.rdram, phys)[0]
+        if (0x10000000 <= phys < 0x1FBFFFFF) and self.rom:
+            rom_addr = phys & 0x0FFFFFFF
             if rom_addr < self.rom_size-3:
-                return struct.unpack('>I', self.rom[rom_addr:rom_addr+4])[0]
-        if addr < len(self.rdram)-3:
-            return struct.unpack('>I', self.rdram[addr:addr+4])[0]
+                return self._u32.unpack_from(self.rom, rom_addr)[0]
         return 0
     def write_word(self, addr:int, value:int):
         addr &= 0x7FFFFF
         if addr < len(self.rdram)-3:
-            struct.pack_into('>I', self.rdram, addr, value & 0xFFFFFFFF)
+            self._u32.pack_into(self.rdram, addr, value & 0xFFFFFFFF)
+            if self.on_code_write:
+                self.on_code_write(addr)
 
 
 # ---------------- Graphics (stub) ----------------
@@ -116,33 +204,147 @@ class Fast3DStub:
 
 
 class VideoInterface:
+    MAX_TRIANGLES = 32
+
     def __init__(self, canvas):
         self.canvas = canvas
         self.frame_count = 0
         self.mode = "fast3d"  # or "demo"
         self.fast3d = Fast3DStub()
+        # Persistent items created once and mutated per frame via
+        # coords/itemconfig; delete("all") + re-creation is never used
+        # on the steady render path.
+        sx, sy = 192, 114
+        self.screen_origin = (sx, sy)
+        self.bg_id = canvas.create_rectangle(sx, sy, sx+640, sy+480,
+                                             fill="#000000", outline="#00ff88", width=2)
+        # Rasterized output: triangles are drawn into an RGB framebuffer
+        # and blitted once per frame as a PPM-encoded PhotoImage, rather
+        # than crossing the Tcl boundary once per primitive.
+        self.fb_w, self.fb_h = 640, 480
+        self.fb = bytearray(self.fb_w * self.fb_h * 3)
+        self._fb_clear = bytes(len(self.fb))
+        self._ppm_header = b"P6\n%d %d\n255\n" % (self.fb_w, self.fb_h)
+        self.fb_img = tk.PhotoImage(width=self.fb_w, height=self.fb_h)
+        self.fb_id = canvas.create_image(sx + 1, sy + 1, anchor='nw', image=self.fb_img)
+        # Set when the PPM blit is unavailable; triangles then go through
+        # the persistent polygon pool instead.
+        self._use_vector = False
+        self.tri_ids = [canvas.create_polygon(0, 0, 0, 0, 0, 0,
+                                              fill="#ff0000", outline="white",
+                                              state="hidden")
+                        for _ in range(self.MAX_TRIANGLES)]
+        self.label_id = canvas.create_text(512, 150, text="Fast3D Triangle Stub",
+                                           font=("Arial", 18), fill="#00ff88",
+                                           state="hidden")
+        self.demo_id = canvas.create_text(512, 300, text="Demo Mode",
+                                          fill="white", state="hidden")
+        self._shown_tris = 0
 
     def render_frame(self, cpu_state):
-        self.canvas.delete("all")
-        screen_x, screen_y = 192, 114
-        self.canvas.create_rectangle(screen_x, screen_y, screen_x+640, screen_y+480,
-                                     fill="#000000", outline="#00ff88", width=2)
-
+        canvas = self.canvas
+        shown = 0
         if self.mode == "demo":
-            # old bouncing balls (removed here for brevity)
-            self.canvas.create_text(512, 300, text="Demo Mode", fill="white")
+            canvas.itemconfig(self.demo_id, state="normal")
+            canvas.itemconfig(self.label_id, state="hidden")
         elif self.mode == "fast3d":
+            canvas.itemconfig(self.demo_id, state="hidden")
+            canvas.itemconfig(self.label_id, state="normal")
             self.fast3d.step()
-            for tri in self.fast3d.triangles:
-                self.canvas.create_polygon(tri, fill="#ff0000", outline="white")
-
-            self.canvas.create_text(512, 150, text="Fast3D Triangle Stub",
-                                    font=("Arial",18), fill="#00ff88")
-
+            if self._use_vector:
+                tris = self.fast3d.triangles[:self.MAX_TRIANGLES]
+                shown = len(tris)
+                for item, tri in zip(self.tri_ids, tris):
+                    # One Tcl call per persistent polygon with raw
+                    # coordinates; no per-frame item creation.
+                    canvas.coords(item,
+                                  tri[0][0], tri[0][1],
+                                  tri[1][0], tri[1][1],
+                                  tri[2][0], tri[2][1])
+                    canvas.itemconfig(item, state="normal")
+            else:
+                sx, sy = self.screen_origin
+                self.fb[:] = self._fb_clear
+                for tri in self.fast3d.triangles:
+                    self._rasterize_triangle([(x - sx, y - sy) for x, y in tri],
+                                             (255, 0, 0))
+                self._blit()
+        # Hide only the pool entries that fell out of use since last frame.
+        for item in self.tri_ids[shown:self._shown_tris]:
+            canvas.itemconfig(item, state="hidden")
+        self._shown_tris = shown
         self.frame_count += 1
 
+    def _rasterize_triangle(self, tri, color):
+        """Incremental edge-function fill.
+
+        The three edge values are evaluated once at the box corner and
+        stepped by per-edge constants (+A per pixel, +B per row) instead
+        of recomputing six products per pixel. Each row's accepted span
+        is contiguous (the triangle is convex), so it is written with a
+        single slice assignment.
+        """
+        (x0, y0), (x1, y1), (x2, y2) = tri
+        minx = max(min(x0, x1, x2), 0)
+        maxx = min(max(x0, x1, x2), self.fb_w - 1)
+        miny = max(min(y0, y1, y2), 0)
+        maxy = min(max(y0, y1, y2), self.fb_h - 1)
+        if minx > maxx or miny > maxy:
+            return
+        area = (x1 - x0) * (y2 - y0) - (y1 - y0) * (x2 - x0)
+        if area == 0:
+            return
+        if area < 0:
+            # Flip winding so all edge functions test >= 0.
+            x1, y1, x2, y2 = x2, y2, x1, y1
+        a12, b12 = y1 - y2, x2 - x1
+        a20, b20 = y2 - y0, x0 - x2
+        a01, b01 = y0 - y1, x1 - x0
+        w0_row = (x2 - x1) * (miny - y1) - (y2 - y1) * (minx - x1)
+        w1_row = (x0 - x2) * (miny - y2) - (y0 - y2) * (minx - x2)
+        w2_row = (x1 - x0) * (miny - y0) - (y1 - y0) * (minx - x0)
+        fb = self.fb
+        fbw = self.fb_w
+        px = bytes(color)
+        for y in range(miny, maxy + 1):
+            w0, w1, w2 = w0_row, w1_row, w2_row
+            start = -1
+            x = minx
+            while x <= maxx:
+                if w0 >= 0 and w1 >= 0 and w2 >= 0:
+                    if start < 0:
+                        start = x
+                elif start >= 0:
+                    break  # left the convex span; nothing more on this row
+                w0 += a12; w1 += a20; w2 += a01
+                x += 1
+            if start >= 0:
+                n = x - start
+                i = (y * fbw + start) * 3
+                fb[i:i + n * 3] = px * n
+            w0_row += b12; w1_row += b20; w2_row += b01
+
+    def _blit(self):
+        # Tk's photo type accepts binary PPM in the -data option, so the
+        # whole frame lands in one image upload. A Tk build that rejects
+        # binary photo data flips rendering to the polygon pool instead.
+        try:
+            self.fb_img = tk.PhotoImage(data=self._ppm_header + bytes(self.fb))
+        except tk.TclError:
+            self._use_vector = True
+            self.canvas.itemconfig(self.fb_id, state="hidden")
+            return
+        self.canvas.itemconfig(self.fb_id, image=self.fb_img)
+
 
 # ---------------- Emulator ----------------
+class FrameSlot:
+    """One CPU-state snapshot handed from the emu thread to the UI."""
+    def __init__(self):
+        self.ready = threading.Event()
+        self.state = None
+
+
 class MIPSEMU:
     def __init__(self, root):
         self.root = root
@@ -153,39 +355,133 @@ class MIPSEMU:
         self.canvas.pack(fill=tk.BOTH, expand=True)
         self.video = VideoInterface(self.canvas)
         self.running = False
+        # The real R4300i would need 93_750_000 // 60 instructions per
+        # frame; a pure-Python core cannot retire that many, so run a
+        # smaller batch per 60 Hz slice and let the pacer take the rest.
+        self.cycles_per_frame = 100_000
+        # Two-slot snapshot ring: the CPU thread publishes into one slot
+        # while the UI consumes the other, so neither thread reads live
+        # mutable state from the other and a Tk stall only drops frames.
+        self.slots = [FrameSlot(), FrameSlot()]
+        self._write_slot = 0
 
         # log
         self.log_text = scrolledtext.ScrolledText(root, height=6, bg="#0a0a0a", fg="#00ff00")
         self.log_text.pack(fill=tk.X)
+        self._log_queue = deque()
+        self.root.after(250, self._flush_log)
         self.log("MIPSEMU 1.0c initialized")
 
-    def log(self, msg): 
-        t = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{t}] {msg}\n"); self.log_text.see(tk.END)
+    def log(self, msg):
+        # Formatting is deferred to the flush; the hot path just records
+        # the raw timestamp alongside the message.
+        self._log_queue.append((time.time(), msg))
+
+    def _flush_log(self):
+        # Queued messages hit the text widget as a single insert every
+        # 250 ms, so a chatty log cannot stall the UI with per-call
+        # relayouts. Messages sharing a second also share one strftime.
+        # The widget is trimmed to keep redraw cost bounded.
+        if self._log_queue:
+            parts = []
+            last_sec = -1
+            stamp = ""
+            for t, msg in self._log_queue:
+                sec = int(t)
+                if sec != last_sec:
+                    stamp = time.strftime("%H:%M:%S", time.localtime(sec))
+                    last_sec = sec
+                parts.append(f"[{stamp}] {msg}\n")
+            self._log_queue.clear()
+            self.log_text.insert(tk.END, "".join(parts))
+            lines = int(self.log_text.index('end-1c').split('.')[0])
+            if lines > 500:
+                self.log_text.delete('1.0', f'{lines - 500}.0')
+            self.log_text.see(tk.END)
+        self.root.after(250, self._flush_log)
 
     def load_rom(self, path):
-        data = Path(path).read_bytes()
-        header = ROMHeader(data)
-        self.memory.load_rom(data)
+        # Mapping and any whole-ROM byte-order conversion run off the UI
+        # thread; the finished state is posted back through after(0, ...).
+        self.log(f"Loading ROM: {os.path.basename(path)}...")
+        threading.Thread(target=self._load_rom_worker, args=(path,),
+                         daemon=True).start()
+
+    def _load_rom_worker(self, path):
+        # Map the file instead of reading it into a bytes object; the OS
+        # pages the cart in lazily and big-endian images are never copied.
+        try:
+            with open(path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            header = ROMHeader(mm[:0x40])
+            self.memory.load_rom(mm, header.endian)
+            if self.memory.rom is not mm:
+                mm.close()  # byte order was converted into a fresh buffer
+        except OSError as e:
+            self.root.after(0, self.log, f"ROM load failed: {e}")
+            return
+        self.root.after(0, self._finish_load, header)
+
+    def _finish_load(self, header):
         self.cpu.reset()
         self.log(f"ROM loaded: {header.name} ({header.game_id})")
 
     def start(self):
         self.running = True; self.cpu.running = True
         threading.Thread(target=self.emu_loop, daemon=True).start()
+        self._next_frame = time.perf_counter() + 1 / 60
         self.render_loop()
 
     def emu_loop(self):
+        # Pace per frame, not per instruction: run one batch, then sleep
+        # off whatever remains of the 1/60 s budget relative to the wall
+        # clock, so throttling no longer caps throughput at 60 instr/s.
+        frame = 1 / 60
+        deadline = time.perf_counter() + frame
+        frames = 0
+        regs_view = self.cpu.registers[:8].tolist()
         while self.running and self.cpu.running:
-            self.cpu.step()
-            time.sleep(1/60)
+            self.cpu.run_block(self.cycles_per_frame)
+            if frames % 6 == 0:
+                # Register display only needs ~10 Hz; skip the
+                # array-to-list conversion on the other frames.
+                regs_view = self.cpu.registers[:8].tolist()
+            frames += 1
+            slot = self.slots[self._write_slot]
+            slot.state = {'pc': self.cpu.pc,
+                          'instructions': self.cpu.instructions_executed,
+                          'registers': regs_view}
+            slot.ready.set()
+            self._write_slot ^= 1
+            now = time.perf_counter()
+            if deadline > now:
+                time.sleep(deadline - now)
+                deadline += frame
+            else:
+                # Batch overran the slice; resync instead of accumulating debt.
+                deadline = now + frame
 
     def render_loop(self):
         if self.running:
-            state = {'pc':self.cpu.pc,'instructions':self.cpu.instructions_executed,
-                     'registers':self.cpu.registers[:8]}
-            self.video.render_frame(state)
-            self.root.after(16,self.render_loop)
+            # Take the freshest published snapshot, if any; an un-ready
+            # pass just reschedules without touching the canvas.
+            state = None
+            for slot in self.slots:
+                if slot.ready.is_set():
+                    state = slot.state
+                    slot.ready.clear()
+            if state is not None:
+                self.video.render_frame(state)
+            # Reschedule against a wall-clock deadline rather than a flat
+            # after(16), which accumulates drift on every tick.
+            self._next_frame += 1 / 60
+            now = time.perf_counter()
+            if self._next_frame <= now:
+                self._next_frame = now + 1 / 60  # fell behind; resync
+                delay = 0
+            else:
+                delay = int((self._next_frame - now) * 1000)
+            self.root.after(delay, self.render_loop)
 
 
 def main():